@@ -42,7 +42,7 @@ source venv/bin/activate
 # Install dependencies
 echo "Installing Python dependencies..."
 pip install --upgrade pip
-pip install openai-whisper python-dotenv requests urllib3
+pip install openai-whisper python-dotenv requests urllib3 "watchfiles>=0.21" pyahocorasick pyobjc-framework-Cocoa
 
 # Run setup script
 echo "Running setup script..."
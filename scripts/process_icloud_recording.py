@@ -5,20 +5,44 @@ import sys
 import time
 import socket
 import logging
+import logging.handlers
 import subprocess
 import urllib.parse
-import fcntl
-import glob
 import shutil
+import threading
+import queue
+import atexit
+import signal
+import hashlib
+import mmap
+import tempfile
 from pathlib import Path
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from dateutil import parser
-from dotenv import load_dotenv
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional
 import re
+import shlex
+from watchfiles import watch, Change
 
-# Load environment variables
-load_dotenv(Path.home() / ".whisper-to-omnifocus.env")
+try:
+    import ahocorasick
+except ImportError:  # Fall back to plain substring checks
+    ahocorasick = None
+
+try:
+    from AppKit import NSWorkspace
+    from Foundation import NSURL
+except ImportError:  # No PyObjC, open URLs with /usr/bin/open
+    NSWorkspace = None
+
+ENV_FILE = Path.home() / ".whisper-to-omnifocus.env"
+
+# Load environment variables before any configuration is read;
+# dotenv is only imported when there is a file to read
+if ENV_FILE.exists():
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
 
 # Configure logging
 log_dir = Path(os.getenv("WHISPER_LOG_DIR", "~/whisper-logs")).expanduser()
@@ -30,19 +54,89 @@ SSH_HOST = os.getenv("WHISPER_SSH_HOST", "localhost")
 SSH_PORT = os.getenv("WHISPER_SSH_PORT", "22")
 SSH_USER = os.getenv("WHISPER_SSH_USER", os.getenv("USER"))
 SSH_KEY = os.path.expanduser(os.getenv("WHISPER_SSH_KEY", "~/.ssh/id_ed25519"))
+SSH_CONTROL_PATH = os.getenv("WHISPER_SSH_CONTROL_PATH", "~/.ssh/cm-%r@%h:%p")
+
+# Shared by every ssh/scp call so they all multiplex over one master connection
+SSH_OPTIONS = [
+    "-i", SSH_KEY,
+    "-o", "BatchMode=yes",
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={SSH_CONTROL_PATH}",
+    "-o", "ControlPersist=600",
+    # Notice a dropped network instead of leaving the remote watcher hanging
+    "-o", "ServerAliveInterval=30",
+]
 
 # Paths matching the shortcut configuration
-WHISPER_BASE = os.path.expanduser(os.getenv("WHISPER_BASE", "~/whisper"))
-TEMP_DIR = os.path.join(WHISPER_BASE, "temp")
-ICLOUD_DIR = os.path.expanduser(os.getenv("WHISPER_ICLOUD_DIR", "~/Library/Mobile Documents/com~apple~CloudDocs/Whisper-local"))
-AUDIO_FILE_PATTERN = os.path.join(ICLOUD_DIR, "audio_recording_*.m4a")
-TRANSCRIPT_FILE = os.path.join(TEMP_DIR, "whisper_transcript.txt")
-OMNIFOCUS_URL_FILE = TRANSCRIPT_FILE + "_url"
-VENV_ACTIVATE = os.path.join(WHISPER_BASE, "whisper-env/bin/activate")
-LOCK_FILE = os.path.join(TEMP_DIR, ".processing.lock")
+WHISPER_BASE = Path(os.path.expandvars(os.getenv("WHISPER_BASE", "~/whisper"))).expanduser()
+TEMP_DIR = WHISPER_BASE / "temp"
+ICLOUD_DIR = Path(os.path.expandvars(os.getenv("WHISPER_ICLOUD_DIR", "~/Library/Mobile Documents/com~apple~CloudDocs/Whisper-local"))).expanduser()
+VENV_ACTIVATE = WHISPER_BASE / "whisper-env/bin/activate"
+# An empty lock file older than this (seconds) was left by a crash mid-create
+LOCK_STALE_AGE = 60
+RECENT_TRANSCRIPTS_FILE = TEMP_DIR / ".recent_transcripts"
+
+# Printed by the remote command right before the transcript contents
+TRANSCRIPT_MARKER = "__WHISPER_TRANSCRIPT__"
+
+# Persistent remote command that prints a line for each change in the temp
+# directory: inotifywait on Linux, fswatch on macOS, exit 127 if neither exists
+REMOTE_WATCH_CMD = (
+    "export PATH=$HOME/bin:/opt/homebrew/bin:/usr/local/bin:$PATH && "
+    f"cd {shlex.quote(str(TEMP_DIR))} && "
+    "if command -v inotifywait >/dev/null 2>&1; then "
+    "exec inotifywait -m -q -e close_write -e moved_to --format %f .; "
+    "elif command -v fswatch >/dev/null 2>&1; then "
+    "exec fswatch .; "
+    "else exit 127; fi"
+)
+# How long the remote directory must be quiet before it is checked (seconds)
+REMOTE_SETTLE_TIME = 2
+
+# Transcripts at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Identical transcripts within this many seconds are treated as duplicates
+DUPLICATE_WINDOW = 60
+
+# How often to retry leftover recordings and check the remote directory (seconds)
+HOUSEKEEPING_INTERVAL = 60
+# Number of recordings transcribed at the same time
+PROCESSING_WORKERS = int(os.getenv("WHISPER_WORKERS", "4"))
+# Keep a <recording>_url.txt copy of each OmniFocus URL in the temp directory
+WRITE_URL_FILE = os.getenv("WHISPER_WRITE_URL_FILE", "").lower() in ("1", "true", "yes")
+# A recording counts as fully written once it has had no events for this long (seconds)
+RECORDING_SETTLE_TIME = 0.3
+# Housekeeping leaves recordings modified more recently than this to the watcher (seconds)
+RECORDING_QUIET_TIME = 2
+# Filesystems where native file events can't be trusted
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'smbfs', 'cifs', 'afpfs', 'webdav', 'fuse.sshfs'}
+
+# Work for the processing workers, as (source, item):
+#   ('icloud', [path, ...])  iCloud recordings to move to temp and upload as one batch
+#   ('uploaded', path)       an iCloud recording from such a batch, now on the server
+#   ('remote', filename)     a recording found in the remote temp directory
+_recording_queue = queue.Queue()
+# Filenames that are queued or being processed, so no recording is picked up twice
+_queued_recordings: Set[str] = set()
+_queued_lock = threading.Lock()
+# Set while the remote watcher is connected, so housekeeping can skip its ls
+_remote_watching = threading.Event()
+# Set when a remote recording failed, so the next housekeeping pass retries it
+_remote_retry = threading.Event()
+# iCloud files moved back after a failure, retried by housekeeping only
+_retry_later: Set[str] = set()
+# Digests of recently processed transcripts, oldest first
+_recent_transcripts: OrderedDict[str, float] = OrderedDict()
+_recent_lock = threading.Lock()
+
+def freeze_keywords(mapping: Dict[str, List[str]]) -> Dict[str, FrozenSet[str]]:
+    """Freeze each keyword list into a frozenset of interned strings."""
+    return {name: frozenset(sys.intern(keyword) for keyword in keywords) for name, keywords in mapping.items()}
 
 # Tag mappings and keywords
-TAG_MAPPINGS = {
+TAG_MAPPINGS = freeze_keywords({
     # Activity tags
     'admin': ['admin', 'administration', 'manage', 'organize'],
     'Bicycle': ['bike', 'bicycle', 'cycling', 'ride'],
@@ -52,7 +146,7 @@ TAG_MAPPINGS = {
     'Read/Review': ['read', 'review', 'book', 'article', 'document'],
     'Research': ['research', 'study', 'investigate', 'analyze'],
     'Running': ['run', 'running', 'jog', 'jogging'],
-    'Shopping': ['shop', 'buy', 'purchase', 'store', 'grocery'],
+    'Shopping': ['shop', 'shopping', 'buy', 'purchase', 'store', 'grocery'],
     'Travel': ['travel', 'trip', 'flight', 'hotel', 'vacation'],
     'Watch': ['watch', 'view', 'stream', 'movie', 'video'],
     'Write': ['write', 'draft', 'compose', 'document'],
@@ -66,13 +160,13 @@ TAG_MAPPINGS = {
     'App/Service': ['app', 'application', 'service', 'software', 'website'],
     'Communicate': ['email', 'call', 'message', 'contact', 'meet', 'chat'],
     'Device': ['phone', 'computer', 'laptop', 'device', 'hardware'],
-    'Errand': ['errand', 'task', 'chore', 'pickup', 'dropoff'],
+    'Errand': ['errand', 'errands', 'task', 'chore', 'pickup', 'dropoff'],
     'Location': ['at', 'in', 'location', 'place', 'where'],
     'Person': ['with', 'person', 'people', 'team', 'group']
-}
+})
 
 # Define common grocery items
-GROCERY_ITEMS = {
+GROCERY_ITEMS = freeze_keywords({
     'vegetables': [
         'tomatoes', 'onions', 'carrots', 'potatoes', 'broccoli', 'lettuce', 'spinach',
         'peppers', 'cucumber', 'celery', 'radishes', 'spring onions', 'garlic',
@@ -102,23 +196,280 @@ GROCERY_ITEMS = {
         'cardamom', 'cloves', 'bay leaves', 'oregano', 'basil', 'thyme',
         'rosemary', 'sage', 'mint', 'chili'
     ]
+})
+
+# Every grocery item, flattened for word lookups
+GROCERY_SET = frozenset(item.lower() for items in GROCERY_ITEMS.values() for item in items)
+# Punctuation dropped from a transcript before looking for grocery items
+_GROCERY_PUNCTUATION = str.maketrans('', '', '.,!?')
+
+def compile_first_match(*patterns: str) -> 're.Pattern':
+    """Fuse patterns into one regex for .match().
+    Like trying each pattern's search() in turn, the first pattern that
+    matches anywhere wins; each pattern names the group holding its value."""
+    return re.compile('|'.join(f'(?s:.*?)(?:{pattern})' for pattern in patterns))
+
+# Date and time patterns, tried in priority order like the original searches
+_WEEKDAYS = r'(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)'
+WEEKDAY_INDEX = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+# "at X time", "at X o'clock" or "X pm/am". Kept as separate patterns: the
+# first one that matches wins, and an invalid time falls through to the next
+_TIME_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"at (\d{1,2}(?::\d{2})?\s*(?:am|pm)?)",
+    r"at (\d{1,2}) o'clock",
+    r"(\d{1,2}(?::\d{2})?\s*(?:am|pm))",
+))
+
+# A fragment matched by _TIME_PATTERNS: "3", "14:30", "3pm" or "2:30 pm"
+_CLOCK_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', re.IGNORECASE)
+
+# "today", "tomorrow", "next Tuesday", "on Monday" or "this Friday",
+# matched against lowercased text; the first one found anywhere wins
+_DAY_RE = compile_first_match(
+    r"(?P<today>today)",
+    r"(?P<tomorrow>tomorrow)",
+    rf"next (?P<next>{_WEEKDAYS})",
+    rf"on (?P<on>{_WEEKDAYS})",
+    rf"this (?P<this>{_WEEKDAYS})",
+)
+
+# Phrases that turn a date into a defer date rather than a due date
+_DEFER_RE = re.compile(
+    r'defer (?:this )?(?:task |action )?(?:to |until |for |on )?'
+    r'|start (?:this )?(?:task |action )?(?:on |at )?'
+    r'|begin (?:this )?(?:task |action )?(?:on |at )?'
+    r'|wait (?:until |for |on )?',
+    re.IGNORECASE
+)
+
+# Detector patterns, compiled once and matched against lowercased text
+_PROJECT_RE = compile_first_match(
+    r'in project (?:called )?["\']?(?P<in_project>[^"\']+)["\']?',
+    r'to project ["\']?(?P<to_project>[^"\']+)["\']?',
+    r'under ["\']?(?P<under_project>[^"\']+)["\']? project',
+    r'@project\((?P<project_tag>[^)]+)\)'
+)
+
+PARALLEL_KEYWORDS = (
+    'parallel tasks',
+    'parallel actions',
+    'can be done in parallel',
+    'can be done simultaneously',
+    'no specific order'
+)
+
+FLAG_KEYWORDS = (
+    'urgent',
+    'important',
+    'priority',
+    'flag',
+    'flagged',
+    'high priority',
+    'critical'
+)
+
+_DURATION_PATTERNS = tuple((re.compile(p), formatter) for p, formatter in (
+    # Pattern for "X hours and Y minutes"
+    (r'(\d+)\s*(?:hour|hr)s?\s*(?:and\s*)?(\d+)?\s*(?:minute|min)s?',
+     lambda h, m=None: f"{int(h)}h{int(m) if m else '0'}m"),
+    # Pattern for just minutes
+    (r'(\d+)\s*(?:minute|min)s?',
+     lambda m: f"{int(m)}m"),
+    # Pattern for just hours
+    (r'(\d+)\s*(?:hour|hr)s?',
+     lambda h: f"{int(h)}h0m"),
+    # Pattern for "takes/duration/estimate X hours and Y minutes"
+    (r'(?:takes|duration|estimate|estimated|about|around)\s+(\d+)\s*(?:hour|hr)s?\s*(?:and\s*)?(\d+)?\s*(?:minute|min)s?',
+     lambda h, m=None: f"{int(h)}h{int(m) if m else '0'}m"),
+    # Pattern for "takes/duration/estimate X minutes"
+    (r'(?:takes|duration|estimate|estimated|about|around)\s+(\d+)\s*(?:minute|min)s?',
+     lambda m: f"{int(m)}m")
+))
+
+# Common folder names to look for (case-insensitive)
+KNOWN_FOLDERS = {
+    'personal': 'Personal',
+    'work': 'Work',
+    'home': 'Home',
+    'family': 'Family',
+    'health': 'Health',
+    'finance': 'Finance'
+}
+
+_FOLDER_RE = compile_first_match(
+    # Most specific patterns first
+    r'^in (?:the )?(?P<leading>[^"\']+?) folder',  # Matches "in the personal folder" at start
+    r'in (?:the )?(?P<anywhere>[^"\']+?) folder',   # Matches "in the personal folder" anywhere
+    r'(?:in|to|into|under|for) (?:the )?(?:folder )?["\']?(?P<quoted>[^"\']+?)["\']? folder',
+    r'(?:in|to|into|under|for) (?:the )?(?P<named>[^"\']+?) folder',
+    r'folder ["\']?(?P<keyword>[^"\']+?)["\']?',
+    r'@folder\((?P<folder_tag>[^)]+)\)'
+)
+
+COMPLETED_KEYWORDS = ('done', 'completed', 'finished', 'complete')
+SEQUENTIAL_KEYWORDS = ('sequential', 'in order', 'one after another', 'step by step')
+HIDE_KEYWORDS = ('hide', 'don\'t show', 'don\'t reveal')
+
+_DEPENDENCY_PATTERNS = tuple(re.compile(p) for p in (
+    r'after (?:completing|finishing|doing) ["\']?([^"\']+)["\']?',
+    r'depends on ["\']?([^"\']+)["\']?',
+    r'requires ["\']?([^"\']+)["\']?',
+    r'needs ["\']?([^"\']+)["\']?',
+    r'@depends\(([^)]+)\)'
+))
+
+_LOCATION_PATTERNS = tuple(re.compile(p) for p in (
+    r'at (?:the )?["\']?([^"\']+)["\']?',
+    r'in (?:the )?["\']?([^"\']+)["\']?',
+    r'@location\(([^)]+)\)'
+))
+
+# Common locations to filter out
+LOCATION_STOPWORDS = {'the', 'a', 'an', 'this', 'that', 'there', 'here', 'it', 'them'}
+
+ENERGY_KEYWORDS = {
+    'low': ('low energy', 'easy', 'simple', 'quick', 'light'),
+    'medium': ('medium energy', 'moderate', 'normal'),
+    'high': ('high energy', 'intensive', 'complex', 'difficult', 'challenging')
 }
 
+_REPEAT_RE = compile_first_match(
+    r'(?P<daily>daily|every day)',
+    r'(?P<weekly>weekly|every week)',
+    r'(?P<monthly>monthly|every month)',
+    r'(?P<yearly>yearly|every year)',
+    rf'every (?P<weekday>{_WEEKDAYS})',
+    r'every (?P<days>\d+) days?',
+    r'every (?P<weeks>\d+) weeks?',
+    r'every (?P<months>\d+) months?'
+)
+
+# Replace multiple spaces and commas between bullet/point with a single space
+_BULLET_SEPARATOR_RE = re.compile(r'\s*,?\s*(?:bullet|point)\s*,?\s*')
+# Look for items followed by 'bullet' or 'point'
+_BULLET_PATTERNS = (
+    re.compile(r'([^.]+?)\s+bullet(?:\s|$)'),  # matches "item bullet"
+    re.compile(r'bullet\s+([^.]+?)(?:\s|$)')    # matches "bullet item"
+)
+# A leftover bullet/point/comma at either end of an item
+_BULLET_TRIM_RE = re.compile(r'^\s*(?:bullet|point|,)\s*|\s*(?:bullet|point|,)\s*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_NOTE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'with note:?\s*(.*)',
+    r'add note:?\s*(.*)',
+    r'include note:?\s*(.*)',
+    r'notes?:?\s*(.*)',
+    r'list:?\s*(.*)',  # Handle "list:" format
+    r'\.?\s*(?:bullet|point)\s*(.*)'  # Handle cases where bullets start after a period
+))
+_TRAILING_PUNCTUATION_RE = re.compile(r'[,.]$')
+
+# Inline #attribute/@attribute markers read by parse_task_attributes, one
+# named group per attribute. A value never starts with another marker, and
+# dates and notes run until the next one
+_ATTR_RE = re.compile(
+    r'[#@]project[= ](?P<project>[^\s#@][^\s]*)'
+    r'|[#@]due[= ](?P<due>[^\s#@][^\s]*(?:\s+[^\s#@][^\s]*)*)'
+    r'|[#@]defer[= ](?P<defer>[^\s#@][^\s]*(?:\s+[^\s#@][^\s]*)*)'
+    r'|(?P<flag>[#@]flag)'
+    r'|[#@]tag[= ](?P<tag>[^\s#@][^\s]*)'
+    r'|[#@]note[= ](?P<note>[^#@].*?)(?=[#@]|$)'
+)
+
+# Runs of letters, so "3pm" still yields the word "pm"
+_WORD_RE = re.compile(r'[^\W\d_]+')
+
+def build_word_tags() -> Dict[str, Tuple[str, ...]]:
+    """Map each single-word tag keyword to its tags.
+    These are matched against whole words, so 'at' doesn't tag 'late'."""
+    word_tags = {}
+    for tag, keywords in TAG_MAPPINGS.items():
+        for keyword in keywords:
+            if _WORD_RE.fullmatch(keyword):
+                # Some keywords (e.g. 'document') belong to more than one tag
+                word_tags[keyword] = word_tags.get(keyword, ()) + (tag,)
+    return word_tags
+
+def build_keyword_index() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Map every detector keyword to the (category, value) hits it produces.
+    Single-word tag keywords are left to WORD_TAGS."""
+    categories = [
+        ('tag', tag, [keyword for keyword in keywords if keyword not in WORD_TAGS])
+        for tag, keywords in TAG_MAPPINGS.items()
+    ]
+    categories += [('energy', level, keywords) for level, keywords in ENERGY_KEYWORDS.items()]
+    categories += [
+        ('parallel', 'parallel', PARALLEL_KEYWORDS),
+        ('flag', 'flag', FLAG_KEYWORDS),
+        ('completed', 'completed', COMPLETED_KEYWORDS),
+        ('sequential', 'sequential', SEQUENTIAL_KEYWORDS),
+        ('hide', 'hide', HIDE_KEYWORDS),
+    ]
+    keyword_index = {}
+    for category, value, keywords in categories:
+        for keyword in keywords:
+            keyword_index[keyword] = keyword_index.get(keyword, ()) + ((category, value),)
+    return keyword_index
+
+def build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every detector keyword."""
+    automaton = ahocorasick.Automaton()
+    for keyword, hits in KEYWORD_INDEX.items():
+        automaton.add_word(keyword, hits)
+    automaton.make_automaton()
+    return automaton
+
+WORD_TAGS = build_word_tags()
+KEYWORD_INDEX = build_keyword_index()
+KEYWORD_AUTOMATON = build_keyword_automaton() if ahocorasick else None
+
 # Ensure directories exist
-os.makedirs(TEMP_DIR, exist_ok=True)
-os.makedirs(ICLOUD_DIR, exist_ok=True)
+TEMP_DIR.mkdir(parents=True, exist_ok=True)
+ICLOUD_DIR.mkdir(parents=True, exist_ok=True)
+
+# Records are formatted by the queue handler and written out by a background
+# thread, so logging never blocks the watcher on disk I/O
+log_queue = queue.Queue(-1)
+# The file gets records in batches of 100, straight away for errors;
+# housekeeping flushes it too so the file never lags far behind
+log_buffer = logging.handlers.MemoryHandler(100, logging.ERROR, logging.FileHandler(log_file))
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    log_buffer,
+    logging.StreamHandler(sys.stdout)
+)
+log_listener.start()
+# atexit runs these in reverse: drain the queue, then flush the buffer
+atexit.register(log_buffer.close)
+atexit.register(log_listener.stop)
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+# watchfiles logs every batch of changes at INFO
+logging.getLogger('watchfiles').setLevel(logging.WARNING)
+
+def ssh_master_running():
+    """Check whether the persistent SSH master connection is up"""
+    check = subprocess.run(
+        ["ssh", *SSH_OPTIONS, "-p", SSH_PORT, "-O", "check", f"{SSH_USER}@{SSH_HOST}"],
+        capture_output=True, text=True
+    )
+    return check.returncode == 0
 
 def can_connect_ssh():
     """Check if we can connect to the SSH server"""
+    # A live master already proves the server is reachable, no new connection needed
+    if ssh_master_running():
+        return True
+    
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.settimeout(1)
     try:
@@ -129,19 +480,41 @@ def can_connect_ssh():
         logging.debug(f"SSH connection test failed: {str(e)}")
         return False
 
+def start_ssh_master():
+    """Open the persistent SSH master connection that later ssh/scp calls reuse"""
+    # Nothing to do if a master is already running
+    if ssh_master_running():
+        return True
+    
+    try:
+        subprocess.run(
+            ["ssh", *SSH_OPTIONS, "-p", SSH_PORT, "-M", "-N", "-f", f"{SSH_USER}@{SSH_HOST}"],
+            capture_output=True, text=True, check=True
+        )
+        logging.info("Opened persistent SSH connection")
+        return True
+    except subprocess.CalledProcessError as e:
+        logging.warning(f"Failed to open persistent SSH connection: {str(e)}")
+        if e.stderr:
+            logging.warning(f"SSH stderr: {e.stderr}")
+        return False
+
+def build_ssh_command(command):
+    """Build the ssh argument list for running a command on the remote server"""
+    return [
+        "ssh",
+        *SSH_OPTIONS,
+        "-p", SSH_PORT,
+        f"{SSH_USER}@{SSH_HOST}",
+        command
+    ]
+
 def run_ssh_command(command, capture_output=True):
     """Run an SSH command with detailed error logging"""
     try:
-        ssh_cmd = [
-            "ssh",
-            "-i", SSH_KEY,
-            "-o", "BatchMode=yes",
-            "-o", "StrictHostKeyChecking=no",
-            "-p", SSH_PORT,
-            f"{SSH_USER}@{SSH_HOST}",
-            command
-        ]
-        logging.debug(f"Running SSH command: {' '.join(ssh_cmd)}")
+        ssh_cmd = build_ssh_command(command)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Running SSH command: %s", ' '.join(ssh_cmd))
         result = subprocess.run(ssh_cmd, capture_output=capture_output, text=True, check=True)
         return True, result.stdout if capture_output else ""
     except subprocess.CalledProcessError as e:
@@ -150,216 +523,215 @@ def run_ssh_command(command, capture_output=True):
             logging.error(f"SSH stderr: {e.stderr}")
         return False, str(e)
 
+def drain_stderr(stream, lines: deque):
+    """Log a process's stderr as it arrives, keeping the last lines for errors"""
+    for line in stream:
+        line = line.rstrip()
+        logging.debug("Remote stderr: %s", line)
+        lines.append(line)
+
+def stream_ssh_command(command):
+    """Run an SSH command and yield its stdout line by line as it arrives.
+    stderr is read on its own thread and logged; raises CalledProcessError
+    with the last lines of it on failure"""
+    ssh_cmd = build_ssh_command(command)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Streaming SSH command: %s", ' '.join(ssh_cmd))
+    stderr_tail = deque(maxlen=20)
+    with subprocess.Popen(ssh_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
+        # Drained separately so stderr can't block the process or mix into stdout
+        drain = threading.Thread(target=drain_stderr, args=(proc.stderr, stderr_tail), daemon=True)
+        drain.start()
+        for line in proc.stdout:
+            yield line
+        drain.join()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, ssh_cmd, stderr="\n".join(stderr_tail))
+
+def upload_recordings(recordings: List[str]) -> bool:
+    """Copy local recordings from TEMP_DIR into the remote TEMP_DIR.
+
+    The files are streamed as one tar archive over the shared SSH
+    connection, so there is no per-file scp handshake."""
+    names = [os.path.basename(recording) for recording in recordings]
+    # Keep macOS tar from adding ._ resource files for iCloud's xattrs
+    tar_env = {**os.environ, "COPYFILE_DISABLE": "1"}
+    tar_cmd = ["tar", "-cf", "-", "-C", str(TEMP_DIR), *names]
+    ssh_cmd = build_ssh_command(shlex.join(["tar", "-xf", "-", "-C", str(TEMP_DIR)]))
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Uploading %s: %s | %s", names, ' '.join(tar_cmd), ' '.join(ssh_cmd))
+    
+    tar = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=tar_env)
+    try:
+        upload = subprocess.run(ssh_cmd, stdin=tar.stdout, capture_output=True, text=True)
+    finally:
+        tar.stdout.close()
+        tar_stderr = tar.stderr.read().decode(errors='replace').strip()
+        tar.stderr.close()
+        tar.wait()
+    
+    if tar.returncode != 0:
+        logging.error(f"tar failed packing audio files (exit {tar.returncode})")
+        if tar_stderr:
+            logging.error(f"tar stderr: {tar_stderr}")
+        return False
+    if upload.returncode != 0:
+        logging.error(f"Upload failed copying audio files (exit {upload.returncode})")
+        if upload.stderr:
+            logging.error(f"SSH stderr: {upload.stderr}")
+        return False
+    return True
+
+def parse_clock_time(fragment: str) -> Optional[str]:
+    """Turn a time fragment into OmniFocus' "hh:mmam" form.
+    Returns None if the fragment isn't a valid time."""
+    match = _CLOCK_RE.fullmatch(fragment)
+    if not match:
+        return None
+    hour = int(match.group(1))
+    minute = int(match.group(2) or 0)
+    meridiem = (match.group(3) or '').lower()
+    if hour > 23 or minute > 59:
+        return None
+    if meridiem == 'pm' and hour < 12:
+        hour += 12
+    elif meridiem == 'am' and hour == 12:
+        hour = 0
+    return "%02d:%02d%s" % (hour % 12 or 12, minute, 'am' if hour < 12 else 'pm')
+
 def parse_date_time(text: str) -> Tuple[Optional[str], Optional[str]]:
     """Parse date and time information from text.
     Returns (defer_date, due_date)"""
-    text = text.lower()
     defer_date = None
     due_date = None
     
-    # Common time patterns
-    today = datetime.now()
-    tomorrow = today + timedelta(days=1)
-    
-    # Pattern for "at X time" or "at X o'clock" or "at X pm/am"
-    time_patterns = [
-        r'at (\d{1,2}(?::\d{2})?\s*(?:am|pm)?)',
-        r'at (\d{1,2}) o\'clock',
-        r'(\d{1,2}(?::\d{2})?\s*(?:am|pm))',
-    ]
-    
-    # Pattern for dates like "on Monday" or "next Tuesday"
-    day_patterns = [
-        r'(today)',
-        r'(tomorrow)',
-        r'next (monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-        r'on (monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-        r'this (monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-    ]
-    
-    # Pattern for defer phrases
-    defer_patterns = [
-        r'defer (?:this )?(?:task |action )?(?:to |until |for |on )?',
-        r'start (?:this )?(?:task |action )?(?:on |at )?',
-        r'begin (?:this )?(?:task |action )?(?:on |at )?',
-        r'wait (?:until |for |on )?'
-    ]
-    
-    # Check if this is a defer date request
-    is_defer_request = any(re.search(pattern, text) for pattern in defer_patterns)
-    
     # Check for time patterns
     time_str = None
-    for pattern in time_patterns:
-        match = re.search(pattern, text)
+    for pattern in _TIME_PATTERNS:
+        match = pattern.search(text)
         if match:
-            time_str = match.group(1)
-            try:
-                # Parse the time string
-                if 'o\'clock' in time_str:
-                    time_str = time_str.replace('o\'clock', '')
-                parsed_time = parser.parse(time_str)
-                time_str = parsed_time.strftime("%I:%M%p").lower()
+            # Move on to the next pattern if it isn't a real time, e.g. "25pm"
+            time_str = parse_clock_time(match.group(1))
+            if time_str:
                 break
-            except ValueError:
-                continue
     
     # Check for date patterns
     date_str = None
-    for pattern in day_patterns:
-        match = re.search(pattern, text)
-        if match:
-            day = match.group(1)
-            if day == 'today':
-                date_str = today.strftime("%Y-%m-%d")
-            elif day == 'tomorrow':
-                date_str = tomorrow.strftime("%Y-%m-%d")
-            else:
-                # Handle "next" or "this" weekday
-                target_day = parser.parse(day).weekday()
-                current_day = today.weekday()
-                days_ahead = target_day - current_day
-                if days_ahead <= 0:  # If the day has passed this week
-                    days_ahead += 7  # Move to next week
-                target_date = today + timedelta(days=days_ahead)
-                date_str = target_date.strftime("%Y-%m-%d")
-            break
+    match = _DAY_RE.match(text.lower())
+    if not match and not time_str:
+        # Most tasks have no date at all, so don't even read the clock
+        logging.debug("Parsed dates - Defer: None, Due: None")
+        return None, None
+    
+    today = datetime.now()
+    today_str = today.strftime("%Y-%m-%d")
+    if match:
+        if match.lastgroup == 'today':
+            date_str = today_str
+        elif match.lastgroup == 'tomorrow':
+            date_str = (today + timedelta(days=1)).strftime("%Y-%m-%d")
+        else:
+            # Handle "next", "on" or "this" weekday
+            target_day = WEEKDAY_INDEX[match.group(match.lastgroup)]
+            current_day = today.weekday()
+            days_ahead = target_day - current_day
+            if days_ahead <= 0:  # If the day has passed this week
+                days_ahead += 7  # Move to next week
+            target_date = today + timedelta(days=days_ahead)
+            date_str = target_date.strftime("%Y-%m-%d")
     
     # Combine date and time if both are present
     if date_str and time_str:
         formatted_datetime = f"{date_str} {time_str}"
     elif date_str:
         formatted_datetime = date_str
-    elif time_str:
-        # If only time is specified, assume today
-        formatted_datetime = f"{today.strftime('%Y-%m-%d')} {time_str}"
     else:
-        formatted_datetime = None
+        # If only time is specified, assume today
+        formatted_datetime = f"{today_str} {time_str}"
     
     # Assign the datetime to either defer_date or due_date based on context
-    if formatted_datetime:
-        if is_defer_request:
-            defer_date = formatted_datetime
-        else:
-            due_date = formatted_datetime
+    if _DEFER_RE.search(text):
+        defer_date = formatted_datetime
+    else:
+        due_date = formatted_datetime
     
-    logging.debug(f"Parsed dates - Defer: {defer_date}, Due: {due_date}")
+    logging.debug("Parsed dates - Defer: %s, Due: %s", defer_date, due_date)
     return defer_date, due_date
 
-def detect_project(text: str) -> Optional[str]:
-    """Detect project name from text using common patterns."""
-    project_patterns = [
-        r'in project (?:called )?["\']?([^"\']+)["\']?',
-        r'to project ["\']?([^"\']+)["\']?',
-        r'under ["\']?([^"\']+)["\']? project',
-        r'@project\(([^)]+)\)'
-    ]
-    
-    for pattern in project_patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            return match.group(1).strip()
+def detect_project(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Detect project name from text using common patterns.
+    Pass text_lower to reuse an already lowercased copy of the text."""
+    text = text_lower if text_lower is not None else text.lower()
+    match = _PROJECT_RE.match(text)
+    if match:
+        return match.group(match.lastgroup).strip()
     return None
 
-def detect_parallel(text: str) -> bool:
-    """Detect if tasks should be parallel based on keywords."""
-    parallel_keywords = [
-        'parallel tasks',
-        'parallel actions',
-        'can be done in parallel',
-        'can be done simultaneously',
-        'no specific order'
-    ]
-    return any(keyword in text.lower() for keyword in parallel_keywords)
-
-def detect_flag(text: str) -> bool:
-    """Detect if task should be flagged based on keywords."""
-    flag_keywords = [
-        'urgent',
-        'important',
-        'priority',
-        'flag',
-        'flagged',
-        'high priority',
-        'critical'
-    ]
-    return any(keyword in text.lower() for keyword in flag_keywords)
-
-def parse_duration(text: str) -> Optional[str]:
-    """Parse duration/estimate from text."""
-    # Patterns for different duration formats
-    duration_patterns = [
-        # Pattern for "X hours and Y minutes"
-        (r'(\d+)\s*(?:hour|hr)s?\s*(?:and\s*)?(\d+)?\s*(?:minute|min)s?', 
-         lambda h, m=None: f"{int(h)}h{int(m) if m else '0'}m"),
-        # Pattern for just minutes
-        (r'(\d+)\s*(?:minute|min)s?',
-         lambda m: f"{int(m)}m"),
-        # Pattern for just hours
-        (r'(\d+)\s*(?:hour|hr)s?',
-         lambda h: f"{int(h)}h0m"),
-        # Pattern for "takes/duration/estimate X hours and Y minutes"
-        (r'(?:takes|duration|estimate|estimated|about|around)\s+(\d+)\s*(?:hour|hr)s?\s*(?:and\s*)?(\d+)?\s*(?:minute|min)s?',
-         lambda h, m=None: f"{int(h)}h{int(m) if m else '0'}m"),
-        # Pattern for "takes/duration/estimate X minutes"
-        (r'(?:takes|duration|estimate|estimated|about|around)\s+(\d+)\s*(?:minute|min)s?',
-         lambda m: f"{int(m)}m")
-    ]
-    
-    text = text.lower()
-    for pattern, formatter in duration_patterns:
-        match = re.search(pattern, text)
+def scan_keywords(text_lower: str) -> Dict[str, Set[str]]:
+    """Find every detector keyword in already lowercased text.
+    Returns the matched values grouped by category."""
+    found = {}
+    if KEYWORD_AUTOMATON is not None:
+        # Single pass over the text finds every keyword at once
+        hits = (hit for _, keyword_hits in KEYWORD_AUTOMATON.iter(text_lower) for hit in keyword_hits)
+    else:
+        hits = (hit for keyword, keyword_hits in KEYWORD_INDEX.items()
+                if keyword in text_lower for hit in keyword_hits)
+    for category, value in hits:
+        found.setdefault(category, set()).add(value)
+    return found
+
+def detect_parallel(text: str, keywords: Optional[Dict[str, Set[str]]] = None) -> bool:
+    """Detect if tasks should be parallel based on keywords.
+    Pass keywords to reuse an existing scan_keywords() result."""
+    if keywords is None:
+        keywords = scan_keywords(text.lower())
+    return 'parallel' in keywords
+
+def detect_flag(text: str, keywords: Optional[Dict[str, Set[str]]] = None) -> bool:
+    """Detect if task should be flagged based on keywords.
+    Pass keywords to reuse an existing scan_keywords() result."""
+    if keywords is None:
+        keywords = scan_keywords(text.lower())
+    return 'flag' in keywords
+
+def parse_duration(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Parse duration/estimate from text.
+    Pass text_lower to reuse an already lowercased copy of the text."""
+    text = text_lower if text_lower is not None else text.lower()
+    for pattern, formatter in _DURATION_PATTERNS:
+        match = pattern.search(text)
         if match:
             try:
                 # Filter out None values and convert to integers
                 groups = [g for g in match.groups() if g is not None]
                 return formatter(*groups)
             except Exception as e:
-                logging.warning(f"Failed to format duration with pattern {pattern}: {str(e)}")
+                logging.warning(f"Failed to format duration with pattern {pattern.pattern}: {str(e)}")
                 continue
     return None
 
-def detect_folder(text: str) -> Optional[str]:
-    """Detect folder name from text using common patterns."""
-    # Common folder names to look for (case-insensitive)
-    KNOWN_FOLDERS = {
-        'personal': 'Personal',
-        'work': 'Work',
-        'home': 'Home',
-        'family': 'Family',
-        'health': 'Health',
-        'finance': 'Finance'
-    }
-    
-    text = text.lower()
-    logging.debug(f"Detecting folder in text: {text}")
+def detect_folder(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Detect folder name from text using common patterns.
+    Pass text_lower to reuse an already lowercased copy of the text."""
+    text = text_lower if text_lower is not None else text.lower()
+    logging.debug("Detecting folder in text: %s", text)
     
     # First check explicit folder patterns
-    folder_patterns = [
-        # Most specific patterns first
-        r'^in (?:the )?([^"\']+?) folder',  # Matches "in the personal folder" at start
-        r'in (?:the )?([^"\']+?) folder',   # Matches "in the personal folder" anywhere
-        r'(?:in|to|into|under|for) (?:the )?(?:folder )?["\']?([^"\']+?)["\']? folder',
-        r'(?:in|to|into|under|for) (?:the )?([^"\']+?) folder',
-        r'folder ["\']?([^"\']+?)["\']?',
-        r'@folder\(([^)]+)\)'
-    ]
-    
-    for pattern in folder_patterns:
-        match = re.search(pattern, text)
-        if match:
-            folder_name = match.group(1).strip()
-            logging.debug(f"Found folder match with pattern '{pattern}': {folder_name}")
-            # Check if it matches a known folder (case-insensitive)
-            folder_lower = folder_name.lower()
-            if folder_lower in KNOWN_FOLDERS:
-                logging.info(f"Matched known folder: {KNOWN_FOLDERS[folder_lower]}")
-                return KNOWN_FOLDERS[folder_lower]
-            logging.info(f"Using custom folder name: {folder_name.title()}")
-            return folder_name.title()  # Return with title case if not a known folder
+    match = _FOLDER_RE.match(text)
+    if match:
+        folder_name = match.group(match.lastgroup).strip()
+        logging.debug("Found folder match with pattern '%s': %s", match.lastgroup, folder_name)
+        # Check if it matches a known folder (case-insensitive)
+        folder_lower = folder_name.lower()
+        if folder_lower in KNOWN_FOLDERS:
+            logging.info(f"Matched known folder: {KNOWN_FOLDERS[folder_lower]}")
+            return KNOWN_FOLDERS[folder_lower]
+        logging.info(f"Using custom folder name: {folder_name.title()}")
+        return folder_name.title()  # Return with title case if not a known folder
     
     # If no explicit folder pattern, check for known folder names in the text
-    words = text.split()
+    words = set(text.split())
     for folder_key, folder_name in KNOWN_FOLDERS.items():
         if folder_key in words:  # Only match whole words
             logging.info(f"Matched folder name in text: {folder_name}")
@@ -368,140 +740,108 @@ def detect_folder(text: str) -> Optional[str]:
     logging.debug("No folder detected in text")
     return None
 
-def detect_task_status(text: str) -> Dict[str, bool]:
-    """Detect task status and reveal preferences."""
+def detect_task_status(text: str, keywords: Optional[Dict[str, Set[str]]] = None) -> Dict[str, bool]:
+    """Detect task status and reveal preferences.
+    Pass keywords to reuse an existing scan_keywords() result."""
     status = {
         'completed': False,
         'reveal': True,  # Default to revealing the task
         'sequential': False
     }
     
+    if keywords is None:
+        keywords = scan_keywords(text.lower())
     # Check for completion
-    if any(word in text.lower() for word in ['done', 'completed', 'finished', 'complete']):
+    if 'completed' in keywords:
         status['completed'] = True
     
     # Check for sequential tasks
-    if any(word in text.lower() for word in ['sequential', 'in order', 'one after another', 'step by step']):
+    if 'sequential' in keywords:
         status['sequential'] = True
     
     # Check for reveal preference
-    if any(word in text.lower() for word in ['hide', 'don\'t show', 'don\'t reveal']):
+    if 'hide' in keywords:
         status['reveal'] = False
     
     return status
 
-def detect_dependencies(text: str) -> List[str]:
-    """Detect task dependencies from text."""
+def detect_dependencies(text: str, text_lower: Optional[str] = None) -> List[str]:
+    """Detect task dependencies from text.
+    Pass text_lower to reuse an already lowercased copy of the text."""
+    text = text_lower if text_lower is not None else text.lower()
     dependencies = []
-    dep_patterns = [
-        r'after (?:completing|finishing|doing) ["\']?([^"\']+)["\']?',
-        r'depends on ["\']?([^"\']+)["\']?',
-        r'requires ["\']?([^"\']+)["\']?',
-        r'needs ["\']?([^"\']+)["\']?',
-        r'@depends\(([^)]+)\)'
-    ]
-    
-    for pattern in dep_patterns:
-        matches = re.finditer(pattern, text.lower())
+    for pattern in _DEPENDENCY_PATTERNS:
+        matches = pattern.finditer(text)
         for match in matches:
             dependencies.append(match.group(1).strip())
     
     return dependencies
 
-def detect_location(text: str) -> Optional[str]:
-    """Detect location context from text."""
-    location_patterns = [
-        r'at (?:the )?["\']?([^"\']+)["\']?',
-        r'in (?:the )?["\']?([^"\']+)["\']?',
-        r'@location\(([^)]+)\)'
-    ]
-    
-    # Common locations to filter out
-    common_words = {'the', 'a', 'an', 'this', 'that', 'there', 'here', 'it', 'them'}
-    
-    for pattern in location_patterns:
-        match = re.search(pattern, text.lower())
+def detect_location(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Detect location context from text.
+    Pass text_lower to reuse an already lowercased copy of the text."""
+    text = text_lower if text_lower is not None else text.lower()
+    for pattern in _LOCATION_PATTERNS:
+        match = pattern.search(text)
         if match:
             location = match.group(1).strip()
             # Filter out common words and very short locations
-            if location and len(location.split()) > 1 and not all(word in common_words for word in location.split()):
+            if location and len(location.split()) > 1 and not all(word in LOCATION_STOPWORDS for word in location.split()):
                 return location
     return None
 
-def detect_energy_level(text: str) -> Optional[str]:
-    """Detect task energy level from text."""
-    energy_patterns = {
-        'low': ['low energy', 'easy', 'simple', 'quick', 'light'],
-        'medium': ['medium energy', 'moderate', 'normal'],
-        'high': ['high energy', 'intensive', 'complex', 'difficult', 'challenging']
-    }
-    
-    text = text.lower()
-    for level, keywords in energy_patterns.items():
-        if any(keyword in text for keyword in keywords):
+def detect_energy_level(text: str, keywords: Optional[Dict[str, Set[str]]] = None) -> Optional[str]:
+    """Detect task energy level from text.
+    Pass keywords to reuse an existing scan_keywords() result."""
+    if keywords is None:
+        keywords = scan_keywords(text.lower())
+    levels = keywords.get('energy', ())
+    # The lowest matching level wins
+    for level in ENERGY_KEYWORDS:
+        if level in levels:
             return level
     return None
 
-def parse_repeat_pattern(text: str) -> Optional[str]:
-    """Parse repeat pattern from text."""
-    repeat_patterns = {
-        r'daily': 'daily',
-        r'every day': 'daily',
-        r'weekly': 'weekly',
-        r'every week': 'weekly',
-        r'monthly': 'monthly',
-        r'every month': 'monthly',
-        r'yearly': 'yearly',
-        r'every year': 'yearly',
-        r'every (monday|tuesday|wednesday|thursday|friday|saturday|sunday)': lambda day: f'weekly-{day}',
-        r'every (\d+) days?': lambda days: f'{days}d',
-        r'every (\d+) weeks?': lambda weeks: f'{weeks}w',
-        r'every (\d+) months?': lambda months: f'{months}m'
-    }
-    
-    text = text.lower()
-    for pattern, formatter in repeat_patterns.items():
-        match = re.search(pattern, text)
-        if match:
-            if callable(formatter):
-                return formatter(*match.groups())
-            return formatter
-    return None
+def parse_repeat_pattern(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Parse repeat pattern from text.
+    Pass text_lower to reuse an already lowercased copy of the text."""
+    text = text_lower if text_lower is not None else text.lower()
+    match = _REPEAT_RE.match(text)
+    if not match:
+        return None
+    kind = match.lastgroup
+    value = match.group(kind)
+    if kind == 'weekday':
+        return f'weekly-{value}'
+    if kind == 'days':
+        return f'{value}d'
+    if kind == 'weeks':
+        return f'{value}w'
+    if kind == 'months':
+        return f'{value}m'
+    return kind  # daily, weekly, monthly or yearly
 
 def parse_bullet_points(text: str) -> Optional[str]:
     """Parse bullet points from text and format them for OmniFocus notes."""
     # First clean up the text by removing unnecessary punctuation
-    # Replace multiple spaces and commas between bullet/point with a single space
-    cleaned_text = re.sub(r'\s*,?\s*(?:bullet|point)\s*,?\s*', ' bullet ', text.lower())
+    cleaned_text = _BULLET_SEPARATOR_RE.sub(' bullet ', text.lower())
     
-    # Look for items followed by 'bullet' or 'point'
-    bullet_patterns = [
-        r'([^.]+?)\s+bullet(?:\s|$)',  # matches "item bullet"
-        r'bullet\s+([^.]+?)(?:\s|$)'    # matches "bullet item"
-    ]
-    
-    bullet_points = []
-    
-    # Process the text line by line to maintain order
-    lines = cleaned_text.split('\n')
-    for line in lines:
+    # Process the text line by line to maintain order; a dict keeps the
+    # first occurrence of each item and drops duplicates
+    bullet_points = {}
+    for line in cleaned_text.split('\n'):
         # Check each pattern
-        for pattern in bullet_patterns:
-            matches = re.finditer(pattern, line)
-            for match in matches:
-                # Get the item (group 1)
-                item = match.group(1).strip()
-                # Clean up the item
-                item = re.sub(r'\s*(?:bullet|point|,)\s*$', '', item)  # Remove trailing bullet/point/comma
-                item = re.sub(r'^\s*(?:bullet|point|,)\s*', '', item)  # Remove leading bullet/point/comma
-                item = re.sub(r'\s+', ' ', item)  # Normalize spaces
-                if item and item not in bullet_points:  # Avoid duplicates
-                    bullet_points.append(item)
+        for pattern in _BULLET_PATTERNS:
+            for match in pattern.finditer(line):
+                # Clean up the item (group 1) and normalize spaces
+                item = _WHITESPACE_RE.sub(' ', _BULLET_TRIM_RE.sub('', match.group(1).strip()))
+                if item:
+                    bullet_points[item] = None
     
     if bullet_points:
         # Format as Markdown bullet points
         formatted_points = '• ' + '\n• '.join(bullet_points)
-        logging.debug(f"Parsed bullet points: {formatted_points}")
+        logging.debug("Parsed bullet points: %s", formatted_points)
         return formatted_points
     
     return None
@@ -509,50 +849,95 @@ def parse_bullet_points(text: str) -> Optional[str]:
 def extract_task_name_and_note(text: str) -> Tuple[str, Optional[str]]:
     """Extract the task name and note content from the text.
     Handles phrases like 'with note:', 'add note:', etc."""
-    note_patterns = [
-        r'with note:?\s*(.*)',
-        r'add note:?\s*(.*)',
-        r'include note:?\s*(.*)',
-        r'notes?:?\s*(.*)',
-        r'list:?\s*(.*)',  # Handle "list:" format
-        r'\.?\s*(?:bullet|point)\s*(.*)'  # Handle cases where bullets start after a period
-    ]
-    
     # Try to find a note section
-    for pattern in note_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _NOTE_PATTERNS:
+        match = pattern.search(text)
         if match:
-            # Split at the note indicator
-            parts = re.split(pattern, text, maxsplit=1, flags=re.IGNORECASE)
-            task_name = parts[0].strip()
+            # Everything before the note indicator is the task name
+            task_name = text[:match.start()].strip()
             note_content = match.group(1).strip()
             
             # If the task name ends with a comma or period, clean it up
-            task_name = re.sub(r'[,.]$', '', task_name)
+            task_name = _TRAILING_PUNCTUATION_RE.sub('', task_name)
             
             return task_name, note_content
     
     # If no note section found, return the whole text as task name
     return text.strip(), None
 
-def create_omnifocus_url(transcript_text, **kwargs):
-    """Create an OmniFocus URL from the transcript text with optional parameters"""
+@dataclass(slots=True)
+class TaskFeatures:
+    """Everything the detectors found in one transcript."""
+    name: str
+    note: Optional[str] = None
+    defer: Optional[str] = None
+    due: Optional[str] = None
+    project: Optional[str] = None
+    folder: Optional[str] = None
+    parallel: bool = False
+    flag: bool = False
+    estimate: Optional[str] = None
+    status: Dict[str, bool] = field(default_factory=dict)
+    dependencies: List[str] = field(default_factory=list)
+    location: Optional[str] = None
+    energy: Optional[str] = None
+    repeat: Optional[str] = None
+    tags: Set[str] = field(default_factory=set)
+
+def analyze(transcript_text: str) -> TaskFeatures:
+    """Run every detector over the transcript once."""
     # First extract task name and note content
     task_name, note_content = extract_task_name_and_note(transcript_text)
     
     # Parse dates from the task name (not the note content)
     defer_date, due_date = parse_date_time(task_name)
     
+    # Lowercase the task name once and share it between the detectors
+    task_lower = task_name.lower()
+    # Find every detector keyword in the task name in one pass
+    keywords = scan_keywords(task_lower)
+    
+    # Tags come from the whole transcript, note included. Without a note
+    # the task name is the whole (stripped) transcript, so reuse its scan
+    if note_content is None:
+        tags = detect_tags(task_name, task_lower, keywords)
+    else:
+        tags = detect_tags(transcript_text)
+    
+    return TaskFeatures(
+        name=task_name,
+        note=note_content,
+        defer=defer_date,
+        due=due_date,
+        project=detect_project(task_name, task_lower),
+        folder=detect_folder(task_name, task_lower),
+        parallel=detect_parallel(task_name, keywords),
+        flag=detect_flag(task_name, keywords),
+        estimate=parse_duration(task_name, task_lower),
+        status=detect_task_status(task_name, keywords),
+        dependencies=detect_dependencies(task_name, task_lower),
+        location=detect_location(task_name, task_lower),
+        energy=detect_energy_level(task_name, keywords),
+        repeat=parse_repeat_pattern(task_name, task_lower),
+        tags=tags
+    )
+
+def create_omnifocus_url(transcript_text, features: Optional[TaskFeatures] = None, **kwargs):
+    """Create an OmniFocus URL from the transcript text with optional parameters.
+    Pass features to reuse an existing analyze() result."""
+    if features is None:
+        features = analyze(transcript_text)
+    
     # Start with the base parameters
     params = {
-        'name': task_name,
+        'name': features.name,
     }
     
     # Add detected dates if found
-    if defer_date:
-        params['defer'] = defer_date
-    if due_date:
-        params['due'] = due_date
+    if features.defer:
+        params['defer'] = features.defer
+    if features.due:
+        params['due'] = features.due
     
     # Handle notes and bullet points
     notes = []
@@ -562,40 +947,36 @@ def create_omnifocus_url(transcript_text, **kwargs):
         notes.append(kwargs['note'])
     
     # Process bullet points in the note content if it exists
-    if note_content:
-        bullet_points = parse_bullet_points(note_content)
+    if features.note:
+        bullet_points = parse_bullet_points(features.note)
         if bullet_points:
             notes.append(bullet_points)
-        elif note_content:  # If there are no bullet points but there is note content
-            notes.append(note_content)
+        else:  # If there are no bullet points but there is note content
+            notes.append(features.note)
     
     # If we have any notes, combine them
     if notes:
         params['note'] = '\n\n'.join(notes)
     
     # Add other parameters (project, folder, etc.)
-    project = detect_project(task_name)
-    if project:
-        params['project'] = project
+    if features.project:
+        params['project'] = features.project
         
-    folder = detect_folder(task_name)
-    if folder:
-        params['folder'] = folder
+    if features.folder:
+        params['folder'] = features.folder
         
-    if detect_parallel(task_name):
+    if features.parallel:
         params['parallel'] = 'true'
         
     # Only set flag if explicitly mentioned (overrides default)
-    flag_detected = detect_flag(task_name)
-    if flag_detected or kwargs.get('flag'):
+    if features.flag or kwargs.get('flag'):
         params['flag'] = 'true'
         
-    estimate = parse_duration(task_name)
-    if estimate:
-        params['estimate'] = estimate
+    if features.estimate:
+        params['estimate'] = features.estimate
     
     # Add task status and preferences
-    status = detect_task_status(task_name)
+    status = features.status
     if status['completed']:
         params['completed'] = 'true'
     if not status['reveal']:
@@ -604,24 +985,20 @@ def create_omnifocus_url(transcript_text, **kwargs):
         params['sequential'] = 'true'
     
     # Add dependencies
-    dependencies = detect_dependencies(task_name)
-    if dependencies:
-        params['dependencies'] = ','.join(dependencies)
+    if features.dependencies:
+        params['dependencies'] = ','.join(features.dependencies)
     
     # Add location context
-    location = detect_location(task_name)
-    if location:
-        params['context'] = location
+    if features.location:
+        params['context'] = features.location
     
     # Add energy level
-    energy = detect_energy_level(task_name)
-    if energy:
-        params['energy'] = energy
+    if features.energy:
+        params['energy'] = features.energy
     
     # Add repeat pattern
-    repeat = parse_repeat_pattern(task_name)
-    if repeat:
-        params['repeat'] = repeat
+    if features.repeat:
+        params['repeat'] = features.repeat
     
     # Add other optional parameters if provided
     if kwargs.get('project'):  # Override detected project if explicitly provided
@@ -637,85 +1014,143 @@ def create_omnifocus_url(transcript_text, **kwargs):
     if kwargs.get('due'):
         params['due'] = kwargs['due']
     
-    # URL encode each parameter
-    encoded_params = []
-    for key, value in params.items():
-        encoded_value = urllib.parse.quote(str(value))
-        encoded_params.append(f"{key}={encoded_value}")
-    
-    # Create the OmniFocus URL
-    url = f"omnifocus:///add?{'&'.join(encoded_params)}"
-    logging.debug(f"Generated OmniFocus URL: {url}")
+    # Create the OmniFocus URL, encoding values the same way quote() does
+    query = urllib.parse.urlencode(params, safe='/', quote_via=urllib.parse.quote)
+    url = f"omnifocus:///add?{query}"
+    logging.debug("Generated OmniFocus URL: %s", url)
     return url
 
-def detect_tags(text: str) -> Set[str]:
-    """Detect relevant tags based on keywords in the text."""
-    text = text.lower()
-    detected_tags = set()
+def detect_tags(text: str, text_lower: Optional[str] = None,
+                keywords: Optional[Dict[str, Set[str]]] = None) -> Set[str]:
+    """Detect relevant tags based on keywords in the text.
+    Pass text_lower and keywords to reuse an already lowercased copy of the
+    text and its scan_keywords() result."""
+    text = text_lower if text_lower is not None else text.lower()
+    if keywords is None:
+        keywords = scan_keywords(text)
+    detected_tags = set(keywords.get('tag', ()))
     
-    # Check each tag's keywords against the text
-    for tag, keywords in TAG_MAPPINGS.items():
-        if any(keyword in text for keyword in keywords):
-            detected_tags.add(tag)
+    # Single-word keywords only count as whole words
+    for word in WORD_TAGS.keys() & set(_WORD_RE.findall(text)):
+        detected_tags.update(WORD_TAGS[word])
     
     return detected_tags
 
+def transcript_key(transcript: str) -> str:
+    """Hash a transcript so long dictations don't bloat the duplicate window."""
+    return hashlib.blake2b(transcript.encode(), digest_size=16).hexdigest()
+
+def purge_recent_transcripts(current_time: float):
+    """Drop transcripts that have aged out of the duplicate window."""
+    while _recent_transcripts and current_time - next(iter(_recent_transcripts.values())) >= DUPLICATE_WINDOW:
+        _recent_transcripts.popitem(last=False)
+
+def load_recent_transcripts():
+    """Restore the duplicate window saved by a previous run."""
+    if not RECENT_TRANSCRIPTS_FILE.exists():
+        return
+    try:
+        entries = []
+        with open(RECENT_TRANSCRIPTS_FILE, 'r') as f:
+            for line in f:
+                if line.strip():
+                    saved_time, key = line.strip().split('|', 1)
+                    entries.append((float(saved_time), key))
+        for saved_time, key in sorted(entries):
+            _recent_transcripts[key] = saved_time
+        purge_recent_transcripts(time.time())
+    except Exception as e:
+        logging.warning(f"Failed to read recent transcripts: {str(e)}")
+
+def save_recent_transcripts():
+    """Persist the duplicate window so a restart doesn't forget it.
+    Nothing is written when the window is empty."""
+    try:
+        with _recent_lock:
+            purge_recent_transcripts(time.time())
+            if not _recent_transcripts:
+                # A stale file would only be parsed and thrown away on the next start
+                RECENT_TRANSCRIPTS_FILE.unlink(missing_ok=True)
+                return
+            # Write a temporary file and swap it in, so a crash can't leave half a window
+            temp_file = RECENT_TRANSCRIPTS_FILE.with_name(RECENT_TRANSCRIPTS_FILE.name + ".tmp")
+            with open(temp_file, 'w') as f:
+                f.writelines(f"{ts}|{key}\n" for key, ts in _recent_transcripts.items())
+            os.replace(temp_file, RECENT_TRANSCRIPTS_FILE)
+    except Exception as e:
+        logging.warning(f"Failed to save recent transcripts: {str(e)}")
+
+def open_url(url: str) -> bool:
+    """Open a URL through Launch Services, falling back to /usr/bin/open."""
+    if NSWorkspace is not None:
+        ns_url = NSURL.URLWithString_(url)
+        if ns_url is not None and NSWorkspace.sharedWorkspace().openURL_(ns_url):
+            return True
+        logging.warning("Launch Services could not open URL, trying open")
+    
+    try:
+        subprocess.run(['open', url], check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        logging.error(f"Failed to open OmniFocus URL: {str(e)}")
+        return False
+
+def read_transcript(transcript_file) -> str:
+    """Read a transcript, stripped of surrounding whitespace."""
+    with open(transcript_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read().decode('utf-8').strip()
+        # Long dictations: decode from the mapping rather than reading a
+        # full bytes copy first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8').strip()
+
+def write_url_file(url_file, url: str):
+    """Write the URL to a temporary file and swap it into place,
+    so readers never see a partly written URL"""
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(url_file), prefix='.', suffix='.tmp', delete=False) as f:
+        f.write(url)
+    os.replace(f.name, url_file)
+
 def process_transcript_to_url(transcript_file, url_file):
     """Convert transcript to OmniFocus URL and save it"""
+    # Set once this transcript is reserved in the duplicate window
+    key = None
     try:
         # Read the transcript
-        with open(transcript_file, 'r') as f:
-            transcript = f.read().strip()
+        transcript = read_transcript(transcript_file)
         
         logging.info(f"Processing transcript: {transcript}")
         
-        # Check if this exact transcript was recently processed (within last minute)
-        recent_transcripts_file = os.path.join(TEMP_DIR, ".recent_transcripts")
-        current_time = time.time()
-        recent_transcripts = {}
-        
-        # Load recent transcripts
-        if os.path.exists(recent_transcripts_file):
-            try:
-                with open(recent_transcripts_file, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            saved_time, saved_transcript = line.strip().split('|', 1)
-                            recent_transcripts[saved_transcript] = float(saved_time)
-            except Exception as e:
-                logging.warning(f"Failed to read recent transcripts: {str(e)}")
-        
-        # Clean up old entries (older than 1 minute)
-        recent_transcripts = {
-            t: ts for t, ts in recent_transcripts.items()
-            if current_time - ts < 60
-        }
-        
-        # Check for duplicate
-        if transcript in recent_transcripts:
-            logging.info("Duplicate transcript detected, skipping task creation")
+        # Nothing to turn into a task
+        if not transcript:
+            logging.info("Empty transcript, skipping task creation")
             return True
         
-        # Add current transcript to recent list
-        recent_transcripts[transcript] = current_time
-        
-        # Save updated recent transcripts
-        try:
-            with open(recent_transcripts_file, 'w') as f:
-                for t, ts in recent_transcripts.items():
-                    f.write(f"{ts}|{t}\n")
-        except Exception as e:
-            logging.warning(f"Failed to save recent transcripts: {str(e)}")
+        # Check if this exact transcript was recently processed (within last minute)
+        current_time = time.time()
+        digest = transcript_key(transcript)
+        with _recent_lock:
+            purge_recent_transcripts(current_time)
+            if digest in _recent_transcripts:
+                logging.info("Duplicate transcript detected, skipping task creation")
+                return True
+            
+            # Add current transcript to recent list; a concurrent worker
+            # with the same transcript now skips it. Released below if the
+            # task isn't created, so a retry isn't taken for a duplicate
+            _recent_transcripts[digest] = current_time
+            key = digest
         
-        # Detect folder first and log the result
-        folder = detect_folder(transcript)
+        # Run every detector once and log the folder
+        features = analyze(transcript)
+        folder = features.folder
         if folder:
             logging.info(f"Detected folder: {folder}")
         else:
             logging.info("No folder detected in transcript")
         
-        # Detect relevant tags
-        detected_tags = detect_tags(transcript)
+        detected_tags = features.tags
         
         # Join multiple tags with commas for OmniFocus
         context = ', '.join(detected_tags) if detected_tags else None
@@ -723,18 +1158,18 @@ def process_transcript_to_url(transcript_file, url_file):
         # Create OmniFocus URL with default parameters and detected tags
         omnifocus_url = create_omnifocus_url(
             transcript,
+            features,
             flag=True,  # Flag all voice tasks by default
             note="Created via Voice Transcription",  # Add a note about the source
-            context=context,  # Add detected tags
-            folder=folder  # Add detected folder
+            context=context  # Add detected tags
         )
         
         # Log the generated URL for debugging
-        logging.debug(f"Generated OmniFocus URL: {omnifocus_url}")
+        logging.debug("Generated OmniFocus URL: %s", omnifocus_url)
         
-        # Save URL to file
-        with open(url_file, 'w') as f:
-            f.write(omnifocus_url)
+        # Only save the URL to a file when asked to, opening it doesn't need one
+        if WRITE_URL_FILE:
+            write_url_file(url_file, omnifocus_url)
         
         if detected_tags:
             logging.info(f"Created OmniFocus URL with tags: {', '.join(detected_tags)}")
@@ -747,132 +1182,184 @@ def process_transcript_to_url(transcript_file, url_file):
             logging.info("No folder specified for task")
 
         # Open the OmniFocus URL directly
-        try:
-            subprocess.run(['open', omnifocus_url], check=True)
-            logging.info("Opened OmniFocus URL")
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Failed to open OmniFocus URL: {str(e)}")
+        if not open_url(omnifocus_url):
             return False
+        logging.info("Opened OmniFocus URL")
+        key = None  # Task created, keep it in the window
             
         return True
     except Exception as e:
         logging.error(f"Failed to create OmniFocus URL: {str(e)}")
         return False
+    finally:
+        if key is not None:
+            with _recent_lock:
+                _recent_transcripts.pop(key, None)
 
-def cleanup_files(local_files=None, remote_files=None):
-    """Clean up files both locally and remotely"""
-    if local_files:
-        for file in local_files:
-            try:
-                if os.path.exists(file):
-                    os.remove(file)
-                    logging.info(f"Removed local file: {file}")
-            except Exception as e:
-                logging.error(f"Failed to remove local file {file}: {str(e)}")
-    
-    if remote_files:
-        cleanup_cmd = "rm -f " + " ".join(f"'{f}'" for f in remote_files)
-        success, _ = run_ssh_command(cleanup_cmd)
-        if not success:
-            logging.warning("Failed to clean up remote files")
-        else:
-            logging.info("Cleaned up remote files")
+def cleanup_files(local_files):
+    """Remove local files, ignoring any that are already gone"""
+    for file in local_files:
+        try:
+            os.unlink(file)
+            logging.info(f"Removed local file: {file}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"Failed to remove local file {file}: {str(e)}")
 
 class FileLock:
-    """Context manager for file locking to prevent duplicate processing"""
+    """Context manager for file locking to prevent duplicate processing.
+
+    The lock file is created exclusively and holds the owner's PID, so a
+    file left behind by a process that has died is taken over."""
+    # Lock files held by this process, to tell them apart from files left
+    # by an earlier process with the same PID. Guarded by held_lock, which
+    # is also held while a lock file is created
+    held: Set[Path] = set()
+    held_lock = threading.Lock()
+
     def __init__(self, lock_file):
-        self.lock_file = lock_file
-        self.lock_fd = None
+        self.lock_file = Path(lock_file)
+        self.acquired = False
 
-    def __enter__(self):
+    def create(self) -> bool:
+        """Create the lock file, taking over a stale one"""
+        for _ in range(2):
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if not self.remove_stale():
+                    return False
+                continue
+            try:
+                os.write(fd, str(os.getpid()).encode())
+            finally:
+                os.close(fd)
+            return True
+        return False
+
+    def remove_stale(self) -> bool:
+        """Remove the lock file if its owner is gone.
+        Returns True if the lock is free to take."""
         try:
-            # Open the lock file (create if doesn't exist)
-            self.lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT)
-            # Try to acquire an exclusive lock
-            fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            owner = self.lock_file.read_text().strip()
+            age = time.time() - self.lock_file.stat().st_mtime
+        except FileNotFoundError:
             return True
-        except (IOError, OSError) as e:
-            if self.lock_fd:
-                os.close(self.lock_fd)
+        if owner == str(os.getpid()):
+            if self.lock_file in FileLock.held:
+                return False
+            # Otherwise left by an earlier process with a recycled PID
+        elif owner.isdigit():
+            try:
+                os.kill(int(owner), 0)
+                return False
+            except ProcessLookupError:
+                pass
+            except PermissionError:  # Alive, owned by another user
+                return False
+        elif age < LOCK_STALE_AGE:
+            # The owner may not have written its PID yet
             return False
+        logging.warning(f"Removing stale lock file left by process {owner or 'unknown'}")
+        self.lock_file.unlink(missing_ok=True)
+        return True
+
+    def __enter__(self):
+        with FileLock.held_lock:
+            self.acquired = self.create()
+            if self.acquired:
+                FileLock.held.add(self.lock_file)
+            return self.acquired
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.lock_fd:
-            # Release the lock and close the file
-            fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
-            os.close(self.lock_fd)
-            try:
-                os.remove(self.lock_file)
-            except OSError:
-                pass
+        with FileLock.held_lock:
+            # Nothing to release if __enter__ failed
+            if not self.acquired:
+                return
+            self.acquired = False
+            FileLock.held.discard(self.lock_file)
+            self.lock_file.unlink(missing_ok=True)
 
-def process_via_ssh(audio_filename):
-    """Process an audio file that's already on the remote server"""
+def recording_lock(base_name: str) -> FileLock:
+    """Lock a single recording so another running instance doesn't process it too"""
+    return FileLock(TEMP_DIR / f".{base_name}.lock")
+
+def remove_remote_recording(audio_filename):
+    """Delete a processed recording from the remote temp directory"""
+    success, _ = run_ssh_command(shlex.join(["rm", "-f", str(TEMP_DIR / audio_filename)]))
+    if not success:
+        logging.warning(f"Failed to remove remote recording: {audio_filename}")
+    return success
+
+def process_via_ssh(audio_filename) -> Optional[bool]:
+    """Process an audio file that's already on the remote server.
+    Returns None if another instance holds the recording's lock."""
     try:
         # Generate unique names for transcript and URL files
         base_name = os.path.splitext(audio_filename)[0]
         transcript_file = f"{base_name}_transcript.txt"
-        url_file = os.path.join(TEMP_DIR, f"{base_name}_url.txt")
+        url_file = TEMP_DIR / f"{base_name}_url.txt"
         
-        with FileLock(LOCK_FILE):
-            # Process the audio file on the remote server
+        remote_audio = shlex.quote(str(TEMP_DIR / audio_filename))
+        remote_transcript = shlex.quote(str(TEMP_DIR / transcript_file))
+        local_transcript = TEMP_DIR / transcript_file
+        
+        # Locked per recording so the workers don't wait on each other
+        with recording_lock(base_name) as locked:
+            if not locked:
+                return None
+            
+            # Transcribe and stream the transcript back in one round-trip. The
+            # audio stays on the server until the task has been created
             process_cmd = (
                 f"export PATH=$HOME/bin:$PATH && "  # Add ffmpeg to PATH
-                f"cd {WHISPER_BASE} && "
-                f"source {VENV_ACTIVATE} && "
+                f"cd {shlex.quote(str(WHISPER_BASE))} && "
+                f"source {shlex.quote(str(VENV_ACTIVATE))} && "
                 f"PYTHONWARNINGS='ignore::UserWarning' python3 -W ignore transcribe.py "
-                f"'{os.path.join(TEMP_DIR, audio_filename)}' '{os.path.join(TEMP_DIR, transcript_file)}'"
+                f"{remote_audio} {remote_transcript} && "
+                f"test -f {remote_transcript} && "
+                f"echo {shlex.quote(TRANSCRIPT_MARKER)} && cat {remote_transcript} && "
+                f"rm -f {remote_transcript}"
             )
-            success, output = run_ssh_command(process_cmd)
-            if not success:
-                logging.error(f"Transcription failed: {output}")
-                return False
-            
-            # Verify the transcript file exists on remote server
-            check_cmd = f"test -f '{os.path.join(TEMP_DIR, transcript_file)}' && echo 'exists'"
-            success, output = run_ssh_command(check_cmd)
-            if not success or 'exists' not in output:
-                logging.error("Transcript file not found on remote server")
-                return False
-            
-            # Copy the transcript back
-            scp_cmd = [
-                "scp",
-                "-i", SSH_KEY,
-                "-o", "BatchMode=yes",
-                "-o", "StrictHostKeyChecking=no",
-                "-P", SSH_PORT,
-                f"{SSH_USER}@{SSH_HOST}:{os.path.join(TEMP_DIR, transcript_file)}",
-                os.path.join(TEMP_DIR, transcript_file)
-            ]
-            
+            # Log transcribe.py's output live and write everything after
+            # the marker straight to the local transcript file
+            recent_output = deque(maxlen=20)
+            transcript_out = None
             try:
-                subprocess.run(scp_cmd, check=True, capture_output=True, text=True)
+                for line in stream_ssh_command(process_cmd):
+                    if transcript_out:
+                        transcript_out.write(line)
+                    elif line.rstrip('\n').endswith(TRANSCRIPT_MARKER):
+                        transcript_out = open(local_transcript, 'w')
+                    else:
+                        output_line = line.rstrip()
+                        logging.debug("Remote: %s", output_line)
+                        recent_output.append(output_line)
             except subprocess.CalledProcessError as e:
-                logging.error(f"SCP failed retrieving transcript: {str(e)}")
+                logging.error(f"Transcription failed: {str(e)}")
+                if recent_output:
+                    logging.error("Remote output:\n" + "\n".join(recent_output))
                 if e.stderr:
-                    logging.error(f"SCP stderr: {e.stderr}")
+                    logging.error(f"SSH stderr:\n{e.stderr}")
                 return False
+            finally:
+                if transcript_out:
+                    transcript_out.close()
             
-            # Verify local transcript file exists and has content
-            if not os.path.exists(os.path.join(TEMP_DIR, transcript_file)):
-                logging.error("Local transcript file not found after SCP")
+            if not transcript_out:
+                logging.error("Transcript not returned by remote server")
                 return False
             
             # Process the transcript to create OmniFocus URL
-            if not process_transcript_to_url(os.path.join(TEMP_DIR, transcript_file), url_file):
+            if not process_transcript_to_url(local_transcript, url_file):
                 return False
+            
+            # Still under the lock, so no other instance picks the audio up again
+            remove_remote_recording(audio_filename)
         
-        # Clean up all files after releasing the lock
-        local_files = [
-            os.path.join(TEMP_DIR, transcript_file),
-            url_file
-        ]
-        remote_files = [
-            os.path.join(TEMP_DIR, audio_filename),
-            os.path.join(TEMP_DIR, transcript_file)
-        ]
-        cleanup_files(local_files, remote_files)
+        # Clean up local files after releasing the lock
+        cleanup_files([local_transcript])
         
         return True
             
@@ -883,26 +1370,25 @@ def process_via_ssh(audio_filename):
 def move_to_temp(audio_file: str) -> str:
     """Move audio file from iCloud to temp directory and return new path."""
     filename = os.path.basename(audio_file)
-    dest_path = os.path.join(TEMP_DIR, filename)
+    dest_path = TEMP_DIR / filename
     try:
         shutil.move(audio_file, dest_path)
         logging.info(f"Moved {filename} to temp directory")
-        return dest_path
+        return str(dest_path)
     except Exception as e:
         logging.error(f"Failed to move file to temp directory: {str(e)}")
         raise
 
 def is_grocery_list(text: str) -> bool:
     """Check if the text contains multiple grocery items."""
-    # Flatten the grocery items list
-    all_groceries = set(item.lower() for sublist in GROCERY_ITEMS.values() for item in sublist)
-    
-    # Count how many grocery items are mentioned in the text
-    words = set(word.lower().strip('.,!?') for word in text.split())
-    grocery_count = sum(1 for word in words if word in all_groceries)
-    
-    # Consider it a grocery list if it contains at least 2 grocery items
-    return grocery_count >= 2
+    # Consider it a grocery list as soon as 2 different grocery items are mentioned
+    found = set()
+    for word in text.lower().translate(_GROCERY_PUNCTUATION).split():
+        if word in GROCERY_SET:
+            found.add(word)
+            if len(found) >= 2:
+                return True
+    return False
 
 def parse_task_attributes(text):
     """Parse task attributes from text using common patterns."""
@@ -916,42 +1402,27 @@ def parse_task_attributes(text):
         'note': None
     }
     
-    # Extract project using #project or @project
-    project_match = re.search(r'[#@]project[= ]([^\s]+)', text)
-    if project_match:
-        attributes['project'] = project_match.group(1)
-        attributes['name'] = re.sub(r'[#@]project[= ][^\s]+', '', attributes['name'])
-
-    # Extract due date using #due or @due
-    due_match = re.search(r'[#@]due[= ]([^\s]+(?:\s+[^\s]+)*)', text)
-    if due_match:
-        attributes['due'] = due_match.group(1)
-        attributes['name'] = re.sub(r'[#@]due[= ][^\s]+(?:\s+[^\s]+)*', '', attributes['name'])
-
-    # Extract defer date using #defer or @defer
-    defer_match = re.search(r'[#@]defer[= ]([^\s]+(?:\s+[^\s]+)*)', text)
-    if defer_match:
-        attributes['defer'] = defer_match.group(1)
-        attributes['name'] = re.sub(r'[#@]defer[= ][^\s]+(?:\s+[^\s]+)*', '', attributes['name'])
-
-    # Extract flag using #flag or @flag
-    if re.search(r'[#@]flag', text):
-        attributes['flag'] = 'true'
-        attributes['name'] = re.sub(r'[#@]flag', '', attributes['name'])
-
-    # Extract tags using #tag or @tag
-    tags_matches = re.finditer(r'[#@]tag[= ]([^\s]+)', text)
-    tags = [m.group(1) for m in tags_matches]
+    # Read every marker in one pass; the first project, due, defer and
+    # note win, every tag is kept, and all markers are cut from the name
+    tags = []
+    name_parts = []
+    name_start = 0
+    for match in _ATTR_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == 'tag':
+            tags.append(match.group(kind))
+        elif kind == 'flag':
+            attributes['flag'] = 'true'
+        elif attributes[kind] is None:
+            value = match.group(kind)
+            attributes[kind] = value.strip() if kind == 'note' else value
+        name_parts.append(text[name_start:match.start()])
+        name_start = match.end()
+    name_parts.append(text[name_start:])
+    attributes['name'] = ''.join(name_parts)
+    
     if tags:
         attributes['tags'] = ','.join(tags)
-        for tag in tags:
-            attributes['name'] = re.sub(r'[#@]tag[= ]' + tag, '', attributes['name'])
-
-    # Extract note using #note or @note
-    note_match = re.search(r'[#@]note[= ](.+?)(?=[#@]|$)', text)
-    if note_match:
-        attributes['note'] = note_match.group(1).strip()
-        attributes['name'] = re.sub(r'[#@]note[= ].+?(?=[#@]|$)', '', attributes['name'])
 
     # Clean up the name
     attributes['name'] = attributes['name'].strip()
@@ -965,104 +1436,310 @@ def parse_task_attributes(text):
     
     return attributes
 
+def is_recording(path: str) -> bool:
+    """Check if a path looks like a recording saved by the shortcut."""
+    name = os.path.basename(path)
+    return name.startswith("audio_recording_") and name.endswith(".m4a")
+
+def watch_filter(change: Change, path: str) -> bool:
+    """Only wake the watcher for new or updated recordings."""
+    return change in (Change.added, Change.modified) and is_recording(path)
+
+def is_network_mount(path: str) -> bool:
+    """Check if the given path lives on a network filesystem.
+
+    FSEvents/inotify are unreliable on network mounts, so the watcher
+    falls back to polling there."""
+    try:
+        result = subprocess.run(['mount'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logging.debug(f"Could not list mounts: {str(e)}")
+        return False
+    
+    real_path = os.path.realpath(path)
+    best_mount, best_type = "", ""
+    for line in result.stdout.splitlines():
+        # macOS: "//user@host/share on /Volumes/share (smbfs, nodev, ...)"
+        # Linux: "host:/export on /mnt type nfs4 (rw,relatime,...)"
+        match = re.match(r'^.+? on (.+?) (?:type (\S+) )?\(([^,)]*)', line)
+        if not match:
+            continue
+        mount_point = match.group(1)
+        fs_type = match.group(2) or match.group(3)
+        if real_path == mount_point or real_path.startswith(mount_point.rstrip('/') + '/'):
+            if len(mount_point) > len(best_mount):
+                best_mount, best_type = mount_point, fs_type
+    
+    return best_type.lower() in NETWORK_FS_TYPES
+
+def restore_to_icloud(audio_file: str):
+    """Move a recording back from the temp directory so it is retried later."""
+    temp_audio_file = TEMP_DIR / os.path.basename(audio_file)
+    if not temp_audio_file.exists():
+        return
+    try:
+        # The move shows up as a new file event; leave the retry to
+        # the housekeeping pass instead of looping on the failure
+        _retry_later.add(audio_file)
+        shutil.move(temp_audio_file, audio_file)
+        logging.info("Moved file back to iCloud for retry")
+    except Exception as move_error:
+        logging.error(f"Failed to move file back to iCloud: {str(move_error)}")
+
+def upload_icloud_files(audio_files: List[str]) -> List[str]:
+    """Send offline recordings from iCloud to the remote server in one batch.
+    Returns the recordings that are now waiting on the server."""
+    available = []
+    for audio_file in audio_files:
+        logging.info(f"Found audio file in iCloud: {audio_file}")
+        if os.path.exists(audio_file):
+            available.append(audio_file)
+        else:
+            logging.info("File is not accessible, skipping...")
+    if not available:
+        return []
+    
+    if not can_connect_ssh():
+        logging.info("Not on home network, leaving files in iCloud for later")
+        return []
+    
+    logging.info(f"Home network detected, uploading {len(available)} iCloud file(s)...")
+    moved = []
+    try:
+        # Move files to temp directory first
+        for audio_file in available:
+            move_to_temp(audio_file)
+            moved.append(audio_file)
+        
+        # Copy them all to the remote server in one go
+        if not upload_recordings([str(TEMP_DIR / os.path.basename(f)) for f in moved]):
+            raise Exception("Upload failed")
+        return moved
+    except Exception as e:
+        logging.error(f"Error during upload: {str(e)}")
+        for audio_file in moved:
+            restore_to_icloud(audio_file)
+        return []
+
+def process_icloud_file(audio_file):
+    """Transcribe an iCloud recording that upload_icloud_files has sent to the server."""
+    result = process_via_ssh(os.path.basename(audio_file))
+    if result:
+        logging.info("Processing complete")
+    elif result is None:
+        # The other instance has the remote copy, nothing to move back
+        logging.info(f"Skipped {audio_file}, another instance is processing it")
+    else:
+        logging.error("Processing failed")
+        # The iCloud copy is retried, so don't leave a second one on the server
+        remove_remote_recording(os.path.basename(audio_file))
+        restore_to_icloud(audio_file)
+
+def check_remote_recordings():
+    """Process recordings that were copied straight to the remote server."""
+    # The directory is quoted, the glob is left for the remote shell to expand
+    check_cmd = f"ls -1 {shlex.quote(str(TEMP_DIR))}/audio_recording_*.m4a 2>/dev/null || true"
+    success, output = run_ssh_command(check_cmd)
+    
+    if success and output.strip():
+        # Process each file found
+        for remote_file in output.strip().split('\n'):
+            audio_filename = os.path.basename(remote_file)
+            if queue_recording('remote', audio_filename):
+                logging.info(f"Found audio file on remote: {audio_filename}")
+
+def watch_remote_recordings():
+    """Check the remote directory as soon as recordings land in it.
+
+    One persistent ssh session runs REMOTE_WATCH_CMD; each burst of changes
+    triggers a single check_remote_recordings once it has settled. When the
+    session drops, or the server has no watcher tool, the housekeeping timer
+    goes back to checking on every pass."""
+    while True:
+        if not can_connect_ssh():
+            time.sleep(HOUSEKEEPING_INTERVAL)
+            continue
+        try:
+            with subprocess.Popen(
+                build_ssh_command(REMOTE_WATCH_CMD),
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ) as proc:
+                _remote_watching.set()
+                logging.info("Watching remote directory for new recordings")
+                # Catch up on anything that arrived before the watcher started
+                check_remote_recordings()
+                timer = None
+                for line in proc.stdout:
+                    if not is_recording(line.strip()):
+                        continue
+                    if timer:
+                        timer.cancel()
+                    timer = threading.Timer(REMOTE_SETTLE_TIME, check_remote_recordings)
+                    timer.daemon = True
+                    timer.start()
+            if proc.returncode == 127:
+                logging.info("No inotifywait or fswatch on the remote server, "
+                             f"checking it every {HOUSEKEEPING_INTERVAL} seconds instead")
+                return
+            logging.warning("Remote watcher disconnected, checking on the housekeeping timer")
+        except Exception as e:
+            logging.error(f"Error watching remote directory: {str(e)}")
+        finally:
+            _remote_watching.clear()
+        time.sleep(HOUSEKEEPING_INTERVAL)
+
+def queue_recording(source: str, recording: str) -> bool:
+    """Hand a recording to the workers unless it is already queued.
+    source is 'remote' for a filename already in the remote temp directory."""
+    with _queued_lock:
+        name = os.path.basename(recording)
+        if name in _queued_recordings:
+            return False
+        _queued_recordings.add(name)
+    _recording_queue.put((source, recording))
+    return True
+
+def queue_icloud_recordings(audio_files: List[str]) -> List[str]:
+    """Hand iCloud recordings to the workers as one batch, skipping queued ones.
+    The batch is uploaded together and then transcribed file by file."""
+    with _queued_lock:
+        batch = [f for f in audio_files if os.path.basename(f) not in _queued_recordings]
+        _queued_recordings.update(os.path.basename(f) for f in batch)
+    if batch:
+        _recording_queue.put(('icloud', batch))
+    return batch
+
+def processing_worker():
+    """Process queued recordings, one at a time per worker thread."""
+    while True:
+        source, recording = _recording_queue.get()
+        # Recordings whose names can be released once this item is done
+        finished = recording if source == 'icloud' else [recording]
+        try:
+            if source == 'icloud':
+                uploaded = upload_icloud_files(recording)
+                # Spread the transcriptions over all workers; their names
+                # stay queued until each one has been processed
+                for audio_file in uploaded:
+                    _recording_queue.put(('uploaded', audio_file))
+                finished = [f for f in recording if f not in uploaded]
+            elif source == 'uploaded':
+                process_icloud_file(recording)
+            else:
+                result = process_via_ssh(recording)
+                if result:
+                    logging.info("Processing complete")
+                elif result is None:
+                    logging.info(f"Skipped {recording}, another instance is processing it")
+                else:
+                    logging.error("Processing failed")
+                    _remote_retry.set()
+        except Exception as e:
+            logging.error(f"Error processing {recording}: {str(e)}")
+        finally:
+            with _queued_lock:
+                _queued_recordings.difference_update(os.path.basename(f) for f in finished)
+            _recording_queue.task_done()
+
+def run_housekeeping():
+    """Retry leftover iCloud recordings and check the remote directory.
+
+    Neither is event-driven, so this runs on a slow timer next to the watchers;
+    the remote check is skipped while the remote watcher is connected."""
+    try:
+        _retry_later.clear()
+        # Pick up recordings left behind while offline or after a failure
+        with os.scandir(ICLOUD_DIR) as entries:
+            # Check the name first: it comes with the directory listing, so
+            # the common non-recording entries never cost a stat
+            recordings = [
+                entry for entry in entries
+                if is_recording(entry.name) and entry.is_file(follow_symlinks=False)
+            ]
+        now = time.time()
+        ready = []
+        for entry in recordings:
+            # The watcher will see the file again once the writer is done
+            if now - entry.stat(follow_symlinks=False).st_mtime < RECORDING_QUIET_TIME:
+                logging.info(f"File is still being written, waiting: {entry.path}")
+                continue
+            ready.append(entry.path)
+        queue_icloud_recordings(sorted(ready))
+        
+        # Then check remote directory for direct SSH recordings, unless the
+        # remote watcher is reporting them and there is no failure to retry
+        if not _remote_watching.is_set() or _remote_retry.is_set():
+            _remote_retry.clear()
+            check_remote_recordings()
+    except Exception as e:
+        logging.error(f"Error during housekeeping: {str(e)}")
+    finally:
+        log_buffer.flush()
+        timer = threading.Timer(HOUSEKEEPING_INTERVAL, run_housekeeping)
+        timer.daemon = True
+        timer.start()
+
 def main():
     """Main function to watch for and process recordings."""
-    logging.info("Starting recording processor (checking every 5 seconds)")
+    logging.info("Starting recording processor (watching for new recordings)")
     logging.info(f"Monitoring iCloud directory: {ICLOUD_DIR}")
     logging.info(f"Monitoring remote directory: {TEMP_DIR}")
     
-    while True:
+    watch_options = {}
+    if is_network_mount(ICLOUD_DIR):
+        logging.info("iCloud directory is on a network mount, falling back to polling")
+        watch_options = {'force_polling': True, 'poll_delay_ms': 2000}
+    
+    # Stop the watcher on SIGTERM (launchd) and return normally, so atexit
+    # handlers run and the exit status is 0. Raising from the handler
+    # instead would surface inside watch() as a KeyboardInterrupt
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    load_recent_transcripts()
+    atexit.register(save_recent_transcripts)
+    
+    if can_connect_ssh():
+        start_ssh_master()
+    
+    for _ in range(PROCESSING_WORKERS):
+        threading.Thread(target=processing_worker, daemon=True).start()
+    
+    threading.Thread(target=watch_remote_recordings, daemon=True).start()
+    
+    # Process anything that arrived while we weren't running
+    run_housekeeping()
+    
+    # Last event time for each recording that is still settling
+    pending: Dict[str, float] = {}
+    
+    while not stop.is_set():
         try:
-            # First, check iCloud directory for offline recordings
-            for audio_file in glob.glob(AUDIO_FILE_PATTERN):
-                logging.info(f"Found audio file in iCloud: {audio_file}")
-                temp_audio_file = None
+            for changes in watch(
+                ICLOUD_DIR,
+                watch_filter=watch_filter,
+                stop_event=stop,
+                rust_timeout=int(RECORDING_SETTLE_TIME * 1000),
+                yield_on_timeout=True,
+                **watch_options
+            ):
+                now = time.monotonic()
+                for _, path in changes:
+                    pending[path] = now
                 
-                # Check if the file is still being written to
-                try:
-                    initial_size = os.path.getsize(audio_file)
-                    time.sleep(1)  # Wait a second
-                    if os.path.getsize(audio_file) != initial_size:
-                        logging.info("File is still being written, waiting...")
-                        continue
-                except OSError:
-                    logging.info("File is not accessible, skipping...")
-                    continue
-                
-                if can_connect_ssh():
-                    logging.info("Home network detected, processing iCloud file...")
-                    try:
-                        # Move file to temp directory first
-                        temp_audio_file = move_to_temp(audio_file)
-                        # Get just the filename for the remote path
-                        audio_filename = os.path.basename(temp_audio_file)
-                        
-                        # Verify the file exists in temp directory
-                        if not os.path.exists(temp_audio_file):
-                            raise Exception("File not found in temp directory after move")
-                        
-                        # Copy to remote server
-                        scp_cmd = [
-                            "scp",
-                            "-i", SSH_KEY,
-                            "-o", "BatchMode=yes",
-                            "-o", "StrictHostKeyChecking=no",
-                            "-P", SSH_PORT,
-                            temp_audio_file,
-                            f"{SSH_USER}@{SSH_HOST}:{os.path.join(TEMP_DIR, audio_filename)}"
-                        ]
-                        
-                        try:
-                            subprocess.run(scp_cmd, check=True, capture_output=True, text=True)
-                        except subprocess.CalledProcessError as e:
-                            logging.error(f"SCP failed copying audio file: {str(e)}")
-                            if e.stderr:
-                                logging.error(f"SCP stderr: {e.stderr}")
-                            raise
-                        
-                        # Verify file exists on remote server
-                        check_cmd = f"test -f '{os.path.join(TEMP_DIR, audio_filename)}' && echo 'exists'"
-                        success, output = run_ssh_command(check_cmd)
-                        if not success or 'exists' not in output:
-                            raise Exception("Audio file not found on remote server after SCP")
-                        
-                        if process_via_ssh(audio_filename):
-                            logging.info("Processing complete")
-                        else:
-                            raise Exception("Processing failed")
-                            
-                    except Exception as e:
-                        logging.error(f"Error during processing: {str(e)}")
-                        # Move file back to iCloud if it exists in temp
-                        if temp_audio_file and os.path.exists(temp_audio_file):
-                            try:
-                                shutil.move(temp_audio_file, audio_file)
-                                logging.info("Moved file back to iCloud for retry")
-                            except Exception as move_error:
-                                logging.error(f"Failed to move file back to iCloud: {str(move_error)}")
-                else:
-                    logging.info("Not on home network, leaving file in iCloud for later")
-            
-            # Then check remote directory for direct SSH recordings
-            check_cmd = f"ls -1 {os.path.join(TEMP_DIR, 'audio_recording_*.m4a')} 2>/dev/null || true"
-            success, output = run_ssh_command(check_cmd)
-            
-            if success and output.strip():
-                # Process each file found
-                for remote_file in output.strip().split('\n'):
-                    audio_filename = os.path.basename(remote_file)
-                    logging.info(f"Found audio file on remote: {audio_filename}")
-                    
-                    if process_via_ssh(audio_filename):
-                        logging.info("Processing complete")
-                    else:
-                        logging.error("Processing failed")
-            
-            time.sleep(5)  # Check every 5 seconds
+                # A recording is complete once it has stopped changing for a moment
+                ready = sorted(
+                    path for path, last_event in pending.items()
+                    if now - last_event > RECORDING_SETTLE_TIME
+                )
+                for audio_file in ready:
+                    del pending[audio_file]
+                queue_icloud_recordings([f for f in ready if f not in _retry_later])
             
         except Exception as e:
             logging.error(f"Error in main loop: {str(e)}")
-            time.sleep(5)  # Wait before retrying
+            stop.wait(5)  # Wait before retrying
+    
+    logging.info("Stopping recording processor")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
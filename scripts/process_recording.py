@@ -2,8 +2,10 @@
 
 import os
 import sys
+import subprocess
 import whisper
 import logging
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -11,6 +13,7 @@ from datetime import datetime
 WHISPER_DIR = "/Users/tomeldridge/whisper"
 TEMP_DIR = os.path.join(WHISPER_DIR, "temp")
 VENV_PATH = "/Users/tomeldridge/Library/Mobile Documents/com~apple~CloudDocs/whisper/whisper-env/bin/activate"
+WHISPER_MODEL = "base"
 
 # Configure logging
 log_dir = Path(os.getenv("WHISPER_LOG_DIR", "~/whisper-logs")).expanduser()
@@ -26,16 +29,19 @@ logging.basicConfig(
     ]
 )
 
-def process_recording(audio_file):
+@lru_cache(maxsize=None)
+def get_model():
+    """Load the Whisper model once and reuse it for every recording"""
+    logging.info(f"Loading Whisper model: {WHISPER_MODEL}")
+    return whisper.load_model(WHISPER_MODEL)
+
+def process_recording(audio_file, model=None):
     """Process a voice recording and create an OmniFocus task."""
     try:
-        # Ensure we're in the correct directory
-        os.chdir(WHISPER_DIR)
-        logging.info(f"Working directory: {os.getcwd()}")
-        
         # Load model and transcribe
         logging.info(f"Processing recording: {audio_file}")
-        model = whisper.load_model("base")
+        if model is None:
+            model = get_model()
         result = model.transcribe(str(audio_file))
         transcribed_text = result["text"].strip()
         logging.info(f"Transcribed text: {transcribed_text}")
@@ -49,9 +55,17 @@ def process_recording(audio_file):
         # Run the OmniFocus script
         omnifocus_script = os.path.join(WHISPER_DIR, "whisper_to_omnifocus.sh")
         if os.path.exists(omnifocus_script):
-            cmd = f"bash {omnifocus_script} {audio_file} {output_file}"
-            logging.info(f"Running OmniFocus script: {cmd}")
-            os.system(cmd)
+            cmd = ["bash", omnifocus_script, str(audio_file), output_file]
+            logging.info(f"Running OmniFocus script: {' '.join(cmd)}")
+            try:
+                subprocess.run(cmd, cwd=WHISPER_DIR, check=True, capture_output=True, text=True)
+            except subprocess.CalledProcessError as e:
+                logging.error(f"OmniFocus script failed: {str(e)}")
+                if e.stdout:
+                    logging.error(f"Script stdout: {e.stdout}")
+                if e.stderr:
+                    logging.error(f"Script stderr: {e.stderr}")
+                raise
         
         return True
         
@@ -64,11 +78,17 @@ def main():
         print("Usage: process_recording.py <audio_file>")
         sys.exit(1)
     
-    audio_file = Path(sys.argv[1])
+    # Resolved first so a relative path still works after the chdir
+    audio_file = Path(sys.argv[1]).resolve()
     if not audio_file.exists():
         logging.error(f"Audio file not found: {audio_file}")
         sys.exit(1)
     
+    # Ensure we're in the correct directory; only when run as a script,
+    # so callers importing process_recording() keep their own
+    os.chdir(WHISPER_DIR)
+    logging.info(f"Working directory: {os.getcwd()}")
+    
     process_recording(audio_file)
 
 if __name__ == "__main__":
@@ -31,17 +31,24 @@ def install_dependencies():
         "openai-whisper",
         "python-dotenv",
         "requests",
-        "urllib3"
+        "urllib3",
+        "watchfiles>=0.21",
+        "pyahocorasick",
+        "pyobjc-framework-Cocoa"
     ]
     
     print("Installing dependencies...")
-    for package in requirements:
-        try:
-            subprocess.run([sys.executable, "-m", "pip", "install", package], check=True)
-            print(f"Successfully installed {package}")
-        except subprocess.CalledProcessError as e:
-            print(f"Error installing {package}: {e}")
-            sys.exit(1)
+    # One pip run resolves everything together instead of once per package
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install",
+             "--disable-pip-version-check", "--no-input", *requirements],
+            check=True
+        )
+        print(f"Successfully installed {', '.join(requirements)}")
+    except subprocess.CalledProcessError as e:
+        print(f"Error installing dependencies: {e}")
+        sys.exit(1)
 
 def create_env_file():
     """Create .env file with default configuration."""
@@ -3,7 +3,6 @@
 import os
 import sys
 import logging
-import subprocess
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -25,6 +24,10 @@ logging.basicConfig(
     ]
 )
 
+# Imported after the env file and logging are set up, since process_recording
+# reads WHISPER_LOG_DIR and configures logging at import
+from process_recording import get_model, process_recording as transcribe_recording
+
 def get_local_recordings():
     """Get list of recordings from local storage on phone."""
     try:
@@ -39,13 +42,13 @@ def get_local_recordings():
         logging.error(f"Error getting local recordings: {e}")
         return []
 
-def process_recording(recording_path):
-    """Process a single recording using the main script."""
+def process_recording(recording_path, model):
+    """Process a single recording in-process with the already loaded model."""
     try:
         logging.info(f"Processing recording: {recording_path}")
-        subprocess.run([sys.executable, "process_recording.py", str(recording_path)], check=True)
+        transcribe_recording(recording_path, model=model)
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         logging.error(f"Error processing recording: {e}")
         return False
 
@@ -59,9 +62,12 @@ def sync_recordings():
     
     logging.info(f"Found {len(local_recordings)} recordings to sync")
     
+    # Load the model once for the whole batch instead of once per recording
+    model = get_model()
+    
     success_count = 0
     for recording in local_recordings:
-        if process_recording(recording):
+        if process_recording(recording, model):
             success_count += 1
     
     logging.info(f"Successfully processed {success_count} of {len(local_recordings)} recordings")